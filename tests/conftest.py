@@ -0,0 +1,47 @@
+"""
+Shared fixtures for the Mergington High School API tests
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from src.app import app, activities
+from tests.helpers import _signup, _unregister
+
+# Seeded participant lists, snapshotted once at import time as tuples so
+# the snapshot itself can't be mutated by a test
+_INITIAL_PARTICIPANTS = {name: tuple(a["participants"]) for name, a in activities.items()}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """Create an in-process async client that calls the ASGI app directly"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(client):
+    """Hit each route once so first-call setup cost isn't charged to a test"""
+    email = "warmup@mergington.edu"
+    assert client.get("/activities").status_code == 200
+    assert _signup(client, email, "Chess Club").status_code == 200
+    assert _unregister(client, email, "Chess Club").status_code == 200
+
+
+@pytest.fixture(autouse=True)
+def _auto_reset():
+    """Restore activities to their pristine state after every test"""
+    yield
+    # Restore in place so the list objects held by the app keep their identity
+    for name, lst in _INITIAL_PARTICIPANTS.items():
+        activities[name]["participants"][:] = lst
@@ -0,0 +1,15 @@
+"""
+Request helpers shared by the Mergington High School API tests
+"""
+
+from urllib.parse import quote
+
+
+def _signup(c, email, activity):
+    """POST a signup, quoting the activity name and email"""
+    return c.post(f"/activities/{quote(activity)}/signup?email={quote(email)}")
+
+
+def _unregister(c, email, activity):
+    """DELETE a registration, quoting the activity name and email"""
+    return c.delete(f"/activities/{quote(activity)}/unregister?email={quote(email)}")
@@ -2,37 +2,29 @@
 Tests for the Mergington High School Activities API
 """
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import activities
+from tests.helpers import _signup, _unregister
 
+# Seeded registrations the unregister tests rely on
+_REGISTERED = [
+    ("Chess Club", "michael@mergington.edu"),
+    ("Art Workshop", "mia@mergington.edu"),
+]
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+def _json(response):
+    """Decode a response body with orjson"""
+    return orjson.loads(response.content)
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        activity_name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for activity_name, details in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after test
-    for activity_name, details in original_activities.items():
-        if activity_name in activities:
-            activities[activity_name]["participants"] = details["participants"].copy()
+
+@pytest.fixture(scope="session")
+def activities_payload(client):
+    """Fetch and decode GET /activities once for the read-only shape tests"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return _json(response)
 
 
 class TestRootEndpoint:
@@ -48,12 +40,9 @@ class TestRootEndpoint:
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_payload):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        data = response.json()
+        data = activities_payload
         assert isinstance(data, dict)
         assert len(data) > 0
         
@@ -62,208 +51,129 @@ class TestGetActivities:
         assert "Soccer Team" in data
         assert "Programming Class" in data
     
-    def test_activity_structure(self, client):
+    def test_activity_structure(self, activities_payload):
         """Test that each activity has the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_details in data.items():
+        for activity_name, activity_details in activities_payload.items():
             assert "description" in activity_details
             assert "schedule" in activity_details
             assert "max_participants" in activity_details
             assert "participants" in activity_details
             assert isinstance(activity_details["participants"], list)
             assert isinstance(activity_details["max_participants"], int)
+    
+    def test_seeded_participants(self, activities_payload):
+        """Test that the seed data has the registrations unregister tests use"""
+        for activity, email in _REGISTERED:
+            assert email in activities_payload[activity]["participants"]
 
 
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_successful(self, client, reset_activities):
-        """Test successful signup for an activity"""
+    @pytest.mark.parametrize("activity", ["Chess Club", "Art Workshop"])
+    def test_signup(self, client, activity):
+        """Test successful signup, including URL-encoded activity names"""
         email = "newstudent@mergington.edu"
-        activity = "Chess Club"
         
-        response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        response = _signup(client, email, activity)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "message" in data
         assert email in data["message"]
         assert activity in data["message"]
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-    
-    def test_signup_duplicate_email(self, client, reset_activities):
-        """Test that signing up with duplicate email fails"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        activity = "Chess Club"
-        
-        response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "already signed up" in data["detail"].lower()
+        assert email in activities[activity]["participants"]
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test that signing up for non-existent activity fails"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Activity"
-        
-        response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_signup_with_url_encoded_activity_name(self, client, reset_activities):
-        """Test signup with URL-encoded activity name"""
-        email = "newstudent@mergington.edu"
-        activity = "Art Workshop"
-        
-        response = client.post(
-            f"/activities/Art%20Workshop/signup?email={email}"
-        )
-        
-        assert response.status_code == 200
-        
-        # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+    @pytest.mark.parametrize("activity,email,status,detail", [
+        # Already in Chess Club
+        ("Chess Club", "michael@mergington.edu", 400, "already signed up"),
+    ])
+    def test_signup_rejected(self, client, activity, email, status, detail):
+        """Test that duplicate signups fail"""
+        response = _signup(client, email, activity)
+        
+        assert response.status_code == status
+        data = _json(response)
+        assert detail in data["detail"].lower()
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_successful(self, client, reset_activities):
-        """Test successful unregistration from an activity"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        activity = "Chess Club"
-        
-        # Verify student is initially registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-        
+    @pytest.mark.parametrize("activity,email", _REGISTERED)
+    def test_unregister(self, client, activity, email):
+        """Test successful unregistration, including URL-encoded activity names"""
         # Unregister
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+        response = _unregister(client, email, activity)
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "message" in data
         assert email in data["message"]
         assert activity in data["message"]
         
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
     
-    def test_unregister_not_registered(self, client, reset_activities):
+    @pytest.mark.parametrize("activity,email,status,detail", [
+        ("Chess Club", "notregistered@mergington.edu", 400, "not signed up"),
+    ])
+    def test_unregister_rejected(self, client, activity, email, status, detail):
         """Test that unregistering a non-registered student fails"""
-        email = "notregistered@mergington.edu"
-        activity = "Chess Club"
+        response = _unregister(client, email, activity)
         
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "not signed up" in data["detail"].lower()
+        assert response.status_code == status
+        data = _json(response)
+        assert detail in data["detail"].lower()
+
+
+class TestNonexistentActivity:
+    """Tests for requests against an activity that does not exist"""
     
-    def test_unregister_nonexistent_activity(self, client):
-        """Test that unregistering from non-existent activity fails"""
-        email = "student@mergington.edu"
-        activity = "Nonexistent Activity"
-        
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+    @pytest.mark.parametrize("send", [_signup, _unregister])
+    def test_nonexistent_activity(self, client, send):
+        """Test that signup and unregister both fail for unknown activities"""
+        response = send(client, "student@mergington.edu", "Nonexistent Activity")
         
         assert response.status_code == 404
-        data = response.json()
+        data = _json(response)
         assert "not found" in data["detail"].lower()
-    
-    def test_unregister_with_url_encoded_activity_name(self, client, reset_activities):
-        """Test unregister with URL-encoded activity name"""
-        email = "mia@mergington.edu"  # Already in Art Workshop
-        activity = "Art Workshop"
-        
-        # Verify student is initially registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
-        
-        # Unregister with URL-encoded name
-        response = client.delete(
-            f"/activities/Art%20Workshop/unregister?email={email}"
-        )
-        
-        assert response.status_code == 200
-        
-        # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
 
 
 class TestIntegration:
     """Integration tests for complete workflows"""
     
-    def test_signup_and_unregister_workflow(self, client, reset_activities):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_signup_and_unregister_workflow(self, aclient):
         """Test complete workflow of signing up and then unregistering"""
         email = "testworkflow@mergington.edu"
         activity = "Drama Club"
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        signup_response = await _signup(aclient, email, activity)
         assert signup_response.status_code == 200
         
         # Verify registration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
-        unregister_response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+        unregister_response = await _unregister(aclient, email, activity)
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
     
-    def test_multiple_signups_different_activities(self, client, reset_activities):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_signups_different_activities(self, aclient):
         """Test that a student can sign up for multiple activities"""
         email = "multisport@mergington.edu"
         activities_to_join = ["Chess Club", "Soccer Team", "Drama Club"]
         
         for activity in activities_to_join:
-            response = client.post(
-                f"/activities/{activity}/signup?email={email}"
-            )
-            assert response.status_code == 200
+            assert (await _signup(aclient, email, activity)).status_code == 200
         
         # Verify student is in all activities
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        
         for activity in activities_to_join:
-            assert email in activities_data[activity]["participants"]
+            assert email in activities[activity]["participants"]